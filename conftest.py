@@ -0,0 +1,42 @@
+# Hypothesis Testing for PickleDB
+# Copyright (C) 2023 Cuiyang (William) Wang
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+
+import os
+from hypothesis import settings, HealthCheck
+from hypothesis.database import DirectoryBasedExampleDatabase
+
+
+# Hypothesis profiles, selected with the HYPOTHESIS_PROFILE environment variable:
+#   dev      - quick local runs (default)
+#   ci       - continuous integration
+#   thorough - nightly runs with many more examples
+# The ci profile keeps failing examples in a persistent database so that later
+# runs replay them first; cache .hypothesis/examples between CI jobs to reuse it.
+# Each profile derives from Hypothesis's own defaults rather than whichever
+# profile happens to be loaded at import time (Hypothesis auto-loads one on CI).
+settings.register_profile(
+    'ci',
+    parent=settings.get_profile('default'),
+    max_examples=25,
+    deadline=None,
+    suppress_health_check=[HealthCheck.too_slow, HealthCheck.data_too_large],
+    database=DirectoryBasedExampleDatabase(
+        os.path.join(os.path.dirname(os.path.abspath(__file__)), '.hypothesis', 'examples')),
+)
+settings.register_profile('dev', parent=settings.get_profile('default'), max_examples=10, deadline=None)
+settings.register_profile('thorough', parent=settings.get_profile('default'), max_examples=500, deadline=None)
+settings.load_profile(os.environ.get('HYPOTHESIS_PROFILE', 'dev'))
@@ -17,37 +17,51 @@
 
 import unittest
 import os
+import contextlib
 import tempfile
-from hypothesis import given, assume, strategies as st
+from hypothesis import given, strategies as st
 import pickledb
 
 
+# Bounded printable-ASCII strategies keep example generation and per-example
+# database work small; pickledb treats all str keys and values alike
+ASCII = st.characters(min_codepoint=32, max_codepoint=126)
+KEY = st.text(alphabet=ASCII, min_size=1, max_size=32)
+VAL = st.text(alphabet=ASCII, max_size=64)
+
+
 class TestPickleDB(unittest.TestCase):
-    def setUp(self):
-        self.db_file = 'test.db'
-        self.db = pickledb.load(self.db_file, False)
+    @classmethod
+    def setUpClass(cls):
+        # auto_dump is off, so a single in-memory database can be shared by all tests
+        cls.db_file = f'test_{os.environ.get("PYTEST_XDIST_WORKER", "0")}.db'
+        cls.db = pickledb.load(cls.db_file, False)
 
-    def tearDown(self):
-        if os.path.exists(self.db_file):
-            os.remove(self.db_file)
+    @classmethod
+    def tearDownClass(cls):
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(cls.db_file)
 
-    @given(st.text(), st.text())
-    def test_set_get(self, key, value):
+    def setUp(self):
+        self._reset()
+
+    def _reset(self):
+        # Hypothesis runs every example between a single setUp/tearDown pair,
+        # so tests that depend on the keyspace reset it at the start of each example.
+        # The store is cleared in place rather than rebound as deldb() does.
+        self.db.db.clear()
+
+    @given(KEY, VAL)
+    def test_basic_ops(self, key, value):
+        # Test set, get, exists and rem on a single key
+        self._reset()
         self.db.set(key, value)
         self.assertEqual(self.db.get(key), value)
-
-    @given(st.text(), st.text())
-    def test_exists(self, key, value):
-        self.db.set(key, value)
         self.assertTrue(self.db.exists(key))
-
-    @given(st.text(), st.text())
-    def test_remove(self, key, value):
-        self.db.set(key, value)
         self.db.rem(key)
         self.assertFalse(self.db.exists(key))
 
-    @given(st.text(), st.lists(st.text()))
+    @given(KEY, st.lists(VAL, max_size=20))
     def test_list_operations(self, key, values):
         # Test list creation, addition, and retrieval
         self.db.lcreate(key)
@@ -55,7 +69,7 @@ class TestPickleDB(unittest.TestCase):
             self.db.ladd(key, value)
         self.assertEqual(self.db.lgetall(key), values)
 
-    @given(st.text(), st.dictionaries(st.text(), st.text()))
+    @given(KEY, st.dictionaries(KEY, VAL, max_size=20))
     def test_dict_operations(self, key, dictionary):
         # Test dictionary creation, addition, and retrieval
         self.db.dcreate(key)
@@ -63,9 +77,10 @@ class TestPickleDB(unittest.TestCase):
             self.db.dadd(key, (k, v))
         self.assertEqual(self.db.dgetall(key), dictionary)
 
-    @given(st.text(), st.text(), st.integers(min_value=1, max_value=100))
+    @given(KEY, st.text(alphabet=ASCII, max_size=16), st.integers(min_value=1, max_value=10))
     def test_append(self, key, value, num):
         # Test appending a value multiple times
+        self._reset()
         self.db.set(key, value)
         for _ in range(num):
             self.db.append(key, value)
@@ -73,14 +88,14 @@ class TestPickleDB(unittest.TestCase):
         self.assertEqual(self.db.get(key), expected_value)
 
     # Test for totalkeys, which returns the number of keys in the database
-    @given(st.lists(st.tuples(st.text(), st.text())))
-    def test_totalkeys(self, key_value_pairs):
-        for key, value in key_value_pairs:
+    @given(st.dictionaries(KEY, VAL, max_size=20))
+    def test_totalkeys(self, data):
+        self._reset()
+        for key, value in data.items():
             self.db.set(key, value)
-        self.assertEqual(self.db.totalkeys(), len(set(key for key, _ in key_value_pairs)))
-        self.db.deldb()
+        self.assertEqual(self.db.totalkeys(), len(data))
 
-    @given(st.text(), st.lists(st.text(), min_size=1))
+    @given(KEY, st.lists(VAL, min_size=1, max_size=20))
     def test_list_pop(self, key, values):
         # Test popping an element from the list
         self.db.lcreate(key)
@@ -90,19 +105,19 @@ class TestPickleDB(unittest.TestCase):
         self.assertEqual(popped_value, values[-1])
         self.assertEqual(self.db.lgetall(key), values[:-1])
 
-    @given(st.text(), st.dictionaries(st.text(), st.text(), min_size=1))
+    @given(KEY, st.dictionaries(KEY, VAL, min_size=1, max_size=20))
     def test_dict_pop(self, key, dictionary):
         # Test popping a key-value pair from the dictionary
         self.db.dcreate(key)
         for k, v in dictionary.items():
             self.db.dadd(key, (k, v))
-        popped_key = next(iter(dictionary))
+        popped_key = min(dictionary)
         popped_value = self.db.dpop(key, popped_key)
         self.assertEqual(popped_value, dictionary[popped_key])
         del dictionary[popped_key]
         self.assertEqual(self.db.dgetall(key), dictionary)
 
-    @given(st.text(), st.integers(min_value=0, max_value=100), st.text())
+    @given(KEY, st.integers(min_value=0, max_value=100), VAL)
     def test_lrange(self, key, num_elements, value):
         # Test lrange functionality
         self.db.lcreate(key)
@@ -112,7 +127,7 @@ class TestPickleDB(unittest.TestCase):
         expected_range = [value] * (end - start)
         self.assertEqual(self.db.lrange(key, start, end), expected_range)
 
-    @given(st.text(), st.lists(st.text()))
+    @given(KEY, st.lists(VAL, max_size=20))
     def test_lremlist(self, key, values):
         # Test removing a list
         self.db.lcreate(key)
@@ -121,65 +136,63 @@ class TestPickleDB(unittest.TestCase):
         self.db.lremlist(key)
         self.assertFalse(self.db.exists(key))
 
-    @given(st.text(), st.text(), st.dictionaries(st.text(), st.text()), st.dictionaries(st.text(), st.text()))
-    def test_dmerge(self, key1, key2, dict1, dict2):
+    @given(st.lists(KEY, min_size=2, max_size=2, unique=True),
+           st.dictionaries(KEY, VAL, max_size=20), st.dictionaries(KEY, VAL, max_size=20))
+    def test_dmerge(self, keys, dict1, dict2):
         # Test merging two dictionaries
-        assume(key1 != key2)
-        self.db.dcreate(key1)
-        for k, v in dict1.items():
-            self.db.dadd(key1, (k, v))
-        self.db.dcreate(key2)
-        for k, v in dict2.items():
-            self.db.dadd(key2, (k, v))
+        key1, key2 = keys
+        self.db.db[key1] = dict(dict1)
+        self.db.db[key2] = dict(dict2)
         self.db.dmerge(key1, key2)
         dict1.update(dict2)
         self.assertEqual(self.db.dgetall(key1), dict1)
 
-    @given(st.text(), st.dictionaries(st.text(), st.text()))
+    @given(KEY, st.dictionaries(KEY, VAL, max_size=20))
     def test_dkeys_dvals(self, key, dictionary):
         # Test retrieval of dictionary keys and values
-        self.db.dcreate(key)
-        for k, v in dictionary.items():
-            self.db.dadd(key, (k, v))
-        self.assertEqual(set(self.db.dkeys(key)), set(dictionary.keys()))
-        self.assertEqual(set(self.db.dvals(key)), set(dictionary.values()))
+        self.db.db[key] = dict(dictionary)
+        self.assertCountEqual(self.db.dkeys(key), dictionary.keys())
+        self.assertCountEqual(self.db.dvals(key), dictionary.values())
 
-    @given(st.text())
+    @given(KEY)
     def test_deldb(self, key):
         # Test deletion of the database
+        self._reset()
         self.db.set(key, 'value')
         self.db.deldb()
         self.assertFalse(self.db.exists(key))
 
-    @given(st.text(), st.text())
+    @given(KEY, VAL)
     def test_getitem_setitem(self, key, value):
         # Test __getitem__ and __setitem__ methods
+        self._reset()
         self.db[key] = value
         self.assertEqual(self.db[key], value)
 
-    @given(st.text())
+    @given(KEY)
     def test_delitem(self, key):
         # Test __delitem__ method
+        self._reset()
         self.db[key] = 'value'
         del self.db[key]
         self.assertFalse(self.db.exists(key))
 
-    @given(st.lists(st.text()))
+    @given(st.lists(KEY, max_size=20))
     def test_getall(self, keys):
         # Test getall method
+        self._reset()
         for key in keys:
             self.db[key] = 'value'
-        self.assertEqual(set(self.db.getall()), set(keys))
-        self.db.deldb()
+        self.assertCountEqual(self.db.getall(), set(keys))
 
-    @given(st.text(), st.lists(st.text()))
+    @given(KEY, st.lists(VAL, max_size=20))
     def test_lextend(self, key, values):
         # Test lextend method
         self.db.lcreate(key)
         self.db.lextend(key, values)
         self.assertEqual(self.db.lgetall(key), values)
 
-    @given(st.text(), st.lists(st.text(), min_size=1))
+    @given(KEY, st.lists(VAL, min_size=1, max_size=20))
     def test_lremvalue(self, key, values):
         # Test lremvalue method
         self.db.lcreate(key)
@@ -190,26 +203,22 @@ class TestPickleDB(unittest.TestCase):
         values.remove(remove_value)
         self.assertEqual(self.db.lgetall(key), values)
 
-    @given(st.text(), st.dictionaries(st.text(), st.text()))
+    @given(KEY, st.dictionaries(KEY, VAL, max_size=20))
     def test_drem(self, key, dictionary):
         # Test drem method (removing a key-value pair from a dictionary)
-        self.db.dcreate(key)
-        for k, v in dictionary.items():
-            self.db.dadd(key, (k, v))
+        self._reset()
+        self.db.db[key] = dict(dictionary)
         self.db.drem(key)
         self.assertFalse(self.db.exists(key))
-        self.db.deldb()
 
-    @given(st.text(), st.dictionaries(st.text(), st.text()), st.text())
+    @given(KEY, st.dictionaries(KEY, VAL, max_size=20), KEY)
     def test_dexists(self, key, dictionary, search_key):
         # Test dexists method (check if a key exists in a dictionary)
-        self.db.dcreate(key)
-        for k, v in dictionary.items():
-            self.db.dadd(key, (k, v))
+        self.db.db[key] = dict(dictionary)
         exists = self.db.dexists(key, search_key)
         self.assertEqual(exists, search_key in dictionary)
 
-    @given(st.dictionaries(keys=st.text(), values=st.text()))
+    @given(st.dictionaries(keys=KEY, values=VAL, max_size=20))
     def test_dump_and_load(self, data):
         # Test dump and load methods for data persistence
         with tempfile.NamedTemporaryFile(delete=False) as tmp:
@@ -229,7 +238,7 @@ class TestPickleDB(unittest.TestCase):
 
         finally:
             # Clean up the temporary file
-            if os.path.exists(database_file):
+            with contextlib.suppress(FileNotFoundError):
                 os.remove(database_file)
 
 
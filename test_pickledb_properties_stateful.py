@@ -16,38 +16,45 @@
 
 
 import os
-from hypothesis import strategies as st
-from hypothesis.stateful import RuleBasedStateMachine, rule, invariant
+import contextlib
+from hypothesis import settings, strategies as st
+from hypothesis.stateful import RuleBasedStateMachine, rule, invariant, precondition
 import unittest
 import pickledb
+from test_pickledb_properties import KEY as NONEMPTY_KEY, VAL
+
+
+# Same keys as the unit properties, plus the empty key, which the state machine also exercises
+KEY = st.one_of(st.just(''), NONEMPTY_KEY)
 
 
 class PickleDBStateMachine(RuleBasedStateMachine):
     def __init__(self):
         super().__init__()
-        self.db_file = 'test_stateful.db'
+        self.db_file = f'test_stateful_{os.environ.get("PYTEST_XDIST_WORKER", "0")}.db'
         self.db = pickledb.load(self.db_file, False)
         self.model = dict()  # Internal model to represent the expected state of the database
+        self._step_count = 0  # Number of steps taken, used to throttle dump_database
 
-    @rule(key=st.text(), value=st.text())
+    @rule(key=KEY, value=VAL)
     def set_value(self, key, value):
         self.db.set(key, value)
         self.model[key] = value
 
-    @rule(key=st.text())
+    @rule(key=KEY)
     def get_value(self, key):
         if key in self.model:
             assert self.db.get(key) == self.model[key]
         else:
             assert self.db.get(key) == False
 
-    @rule(key=st.text())
+    @rule(key=KEY)
     def delete_key(self, key):
         self.db.rem(key)
         self.model.pop(key, None)
         assert self.db.get(key) == False
 
-    @rule(key=st.text(), value=st.text())
+    @rule(key=KEY, value=VAL)
     def update_value(self, key, value):
         if key in self.model:
             self.db.set(key, value)
@@ -57,6 +64,8 @@ class PickleDBStateMachine(RuleBasedStateMachine):
     def list_keys(self):
         assert set(self.db.getall()) == set(self.model.keys())
 
+    # Dumping and reloading goes through the disk, so only do it every 10th step
+    @precondition(lambda self: len(self.model) > 0 and self._step_count % 10 == 0)
     @rule()
     def dump_database(self):
         self.db.dump()
@@ -64,19 +73,25 @@ class PickleDBStateMachine(RuleBasedStateMachine):
         for key in self.model:
             assert reloaded_db.get(key) == self.model[key]
 
+    @invariant()
+    def count_steps(self):
+        self._step_count += 1
+
     @invariant()
     def db_matches_model(self):
+        # Keys are checked as sets first so a missing or extra key is reported directly
+        assert not (self.db.db.keys() ^ self.model.keys())
         for key in self.model:
-            assert self.db.get(key) == self.model[key]
-        for key in self.db.getall():
-            assert key in self.model
+            assert self.db.db[key] == self.model[key]
 
     def teardown(self):
-        if os.path.exists(self.db_file):
+        with contextlib.suppress(FileNotFoundError):
             os.remove(self.db_file)
 
 
 TestPickleDBStateMachine = PickleDBStateMachine.TestCase
+# Shorter traces; the number of traces still comes from the active settings profile
+TestPickleDBStateMachine.settings = settings(PickleDBStateMachine.TestCase.settings, stateful_step_count=20)
 
 
 if __name__ == '__main__':